@@ -2,8 +2,12 @@
 
 # stdlib imports
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import argparse
-from collections import OrderedDict
+import functools
+import operator
+import os
+from collections import OrderedDict, deque
 import sys
 import warnings
 import textwrap
@@ -44,6 +48,12 @@ REV_PROCESS_LEVELS = {
     "derived time series": "V3",
 }
 
+# Number of rows to collect before writing them to a streamed CSV catalog
+CSV_BATCH_ROWS = 10000
+
+_STANDARD_GETTER = operator.itemgetter("source_format", "process_level")
+_COORDINATES_GETTER = operator.itemgetter("latitude", "longitude")
+
 
 
 class App:
@@ -68,9 +78,6 @@ class App:
         logger = logging.getLogger()
         logger.setLevel(logging.CRITICAL)
         warnings.filterwarnings("ignore")
-        pd.set_option("display.max_columns", 10000)
-        pd.set_option("display.max_colwidth", 10000)
-        pd.set_option("display.expand_frame_repr", False)
 
         do_save = outfile is not None
 
@@ -78,7 +85,7 @@ class App:
         if not Path(dir).is_dir():
             raise OSError(f"Directory '{dir}' does not exist.")
         
-        df, errors = render_dir(dir, concise=concise, save=do_save)
+        df, errors = render_dir(dir, concise=concise, save=do_save, outfile=outfile)
         if outfile is not None and concise:
             save_path = Path(outfile)
             fbase = save_path.parent / save_path.stem
@@ -90,71 +97,205 @@ class App:
                 df.to_excel(outfile, index=False)
                 errors.to_excel(errfile, index=False)
             else:
-                df.to_csv(outfile, index=False)
-                errors.to_csv(errfile, index=False)
+                # the catalog itself was already written by render_concise
+                with open(errfile, "wb") as fh:
+                    _write_csv(errors, fh)
         if not outfile and not quiet_errors:
+            _set_display_options()
             print(errors.to_string(index=False))
 
 
+def _set_display_options():
+    # Only called right before printing a dataframe, so that paths that never
+    # print (e.g., --help or a missing directory) do not have to import pandas.
+    pd.set_option("display.max_columns", 10000)
+    pd.set_option("display.max_colwidth", 10000)
+    pd.set_option("display.expand_frame_repr", False)
+
+
 def get_dataframe(filename, stream):
     rows = []
     for trace in stream:
-        row = {}
-        row["Filename"] = filename
-        row["Format"] = trace.stats["standard"]["source_format"]
-        plevel = trace.stats["standard"]["process_level"]
-        row["Process Level"] = REV_PROCESS_LEVELS[plevel]
-        row["Start Time"] = trace.stats.starttime
-        row["End Time"] = trace.stats.endtime
-        dt = trace.stats.endtime - trace.stats.starttime
-        row["Duration (s)"] = dt
-        row["Network"] = trace.stats.network
-        row["Station"] = trace.stats.station
-        row["Channel"] = trace.stats.channel
-        row["Sampling Rate (Hz)"] = trace.stats.sampling_rate
-        row["Latitude"] = trace.stats.coordinates["latitude"]
-        row["Longitude"] = trace.stats.coordinates["longitude"]
-        rows.append(row.copy())
-    df = pd.DataFrame(rows)
+        # bind the AttribDict lookups to locals once per trace
+        stats = trace.stats
+        fmt, plevel = _STANDARD_GETTER(stats["standard"])
+        lat, lon = _COORDINATES_GETTER(stats["coordinates"])
+        starttime = stats.starttime
+        endtime = stats.endtime
+        rows.append(
+            (
+                filename,
+                fmt,
+                REV_PROCESS_LEVELS.get(plevel, "V?"),
+                starttime,
+                endtime,
+                endtime - starttime,
+                stats.network,
+                stats.station,
+                stats.channel,
+                stats.sampling_rate,
+                lat,
+                lon,
+            )
+        )
+    df = pd.DataFrame.from_records(rows, columns=COLUMNS)
     return df
 
 
-def render_concise(files, save=False):
-    df = pd.DataFrame(columns=COLUMNS, index=None)
-    folders = []
-    error_rows = []
+def _read_one(path):
+    """Read a file and tabulate its streams.
+
+    Read and tabulation errors are caught here so that worker threads do not
+    raise and the calling thread only has to consume the results.
+
+    Args:
+        path (pathlib.Path):
+            Path to the data file.
+
+    Returns:
+        tuple: (path, list of DataFrames, exception or None).
+    """
+    # only header fields are tabulated, so skip reading samples where
+    # the reader supports it
+    try:
+        streams = readmod.read_data(str(path), headonly=True)
+        frames = [get_dataframe(path, stream) for stream in streams]
+    except Exception as e:
+        return (path, [], e)
+    return (path, frames, None)
+
+
+def _write_csv(df, fh, header=True):
+    """Write a dataframe as CSV to a file opened in binary mode.
+
+    Args:
+        df (pandas.DataFrame):
+            Dataframe to write.
+        fh (file):
+            File handle opened in binary mode.
+        header (bool):
+            Write the column names before the rows?
+    """
+    fh.write(df.to_csv(header=header, index=False).encode())
+
+
+def _ordered_map(executor, func, items, window):
+    """Map func over items with an executor, yielding results in order.
+
+    Unlike Executor.map, which submits every item up front, at most window
+    items are in flight at a time, so a slow early item does not cause the
+    results of all later items to pile up in memory.
+
+    Args:
+        executor (concurrent.futures.Executor):
+            Executor to run the calls.
+        func (callable):
+            Function to call with each item.
+        items (iterable):
+            Items to pass to func.
+        window (int):
+            Maximum number of submitted calls whose results have not been
+            consumed yet.
+
+    Yields:
+        Result of func for each item, in the order of items.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(func, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def render_concise(files, save=False, outfile=None):
+    frames = []
+    folders = set()
+    err_fnames, err_msgs = [], []
     for path in files:
         fpath = path.parent
         if fpath not in folders:
             sys.stderr.write(f"Parsing files from subfolder {fpath}...\n")
-            folders.append(fpath)
-        try:
-            streams = readmod.read_data(str(path))
-            for stream in streams:
-                tdf = get_dataframe(path, stream)
-                df = pd.concat([df, tdf], axis=0)
-        except BaseException as e:
-            row = {}
-            row["Filename"] = str(path)
-            row["Error"] = str(e)
-            error_rows.append(row)
-            continue
-    errors = pd.DataFrame(error_rows)
+            folders.add(fpath)
+
+    # A CSV catalog is written as the files are read so that the whole
+    # catalog never has to be held in memory; Excel files cannot be appended
+    # to, so they are still written from a single dataframe by the caller.
+    # The rows go to a temporary file that only replaces outfile once the
+    # catalog is complete.
+    stream_csv = outfile is not None and Path(outfile).suffix != ".xlsx"
+    if stream_csv:
+        tmpfile = Path(outfile).with_name(Path(outfile).name + ".part")
+        fh = open(tmpfile, "wb")
+    else:
+        fh = None
+    write_header = True
+    # streamed rows are buffered and written in batches of CSV_BATCH_ROWS
+    batch = []
+    batch_rows = 0
+
+    # Files are independent, and reading is dominated by I/O, so read them
+    # concurrently; results come back in the original file order.
+    max_workers = os.cpu_count() or 1
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = _ordered_map(executor, _read_one, files, 2 * max_workers)
+            for path, tdfs, error in results:
+                if fh is None:
+                    frames.extend(tdfs)
+                else:
+                    batch.extend(tdfs)
+                    batch_rows += sum(len(tdf) for tdf in tdfs)
+                    if batch_rows >= CSV_BATCH_ROWS:
+                        chunk = pd.concat(batch, axis=0, ignore_index=True)
+                        _write_csv(chunk, fh, header=write_header)
+                        write_header = False
+                        batch = []
+                        batch_rows = 0
+                if error is not None:
+                    err_fnames.append(str(path))
+                    err_msgs.append(str(error))
+        if fh is not None:
+            if batch:
+                chunk = pd.concat(batch, axis=0, ignore_index=True)
+                _write_csv(chunk, fh, header=write_header)
+            elif write_header:
+                _write_csv(pd.DataFrame(columns=COLUMNS), fh)
+            fh.close()
+            os.replace(tmpfile, outfile)
+    except BaseException:
+        if fh is not None:
+            fh.close()
+            tmpfile.unlink(missing_ok=True)
+        raise
+    errors = pd.DataFrame({"Filename": err_fnames, "Error": err_msgs})
+
+    if stream_csv:
+        # rows were written in file order, unsorted
+        return (None, errors)
+
+    # concatenate once at the end rather than growing the frame per stream
+    if frames:
+        df = pd.concat(frames, axis=0, ignore_index=True, copy=False)
+    else:
+        df = pd.DataFrame(columns=COLUMNS)
 
     # organize dataframe by network, station, and channel
     df = df.sort_values(["Network", "Station", "Channel"])
     if not save:
+        _set_display_options()
         print(df.to_string(index=False))
 
     return (df, errors)
 
 
-def render_dir(rootdir, concise=True, save=False):
+def render_dir(rootdir, concise=True, save=False, outfile=None):
     rootdir = Path(rootdir)
     datafiles = list(_walk(rootdir))
 
     if concise:
-        df, errors = render_concise(datafiles, save=save)
+        df, errors = render_concise(datafiles, save=save, outfile=outfile)
     else:
         errors = render_verbose(datafiles)
         df = None
@@ -162,60 +303,99 @@ def render_dir(rootdir, concise=True, save=False):
     return (df, errors)
 
 
+def _inspect_one(fname, config):
+    """Read a file and collect the station and channel summaries.
+
+    The format shown is taken from the stats of the stream that was read.
+
+    Args:
+        fname (pathlib.Path):
+            Path to the data file.
+        config (dict):
+            Dictionary containing configuration.
+
+    Returns:
+        tuple: (fname, station OrderedDict, list of channel OrderedDicts,
+        exception or None).
+    """
+    try:
+        stream = readmod.read_data(fname, config)[0]
+        stats = stream[0].stats
+        tpl = (
+            stats["coordinates"]["latitude"],
+            stats["coordinates"]["longitude"],
+            stats["coordinates"]["elevation"],
+        )
+        locstr = "Lat: %.4f Lon: %.4f Elev: %.1f" % tpl
+        mydict = OrderedDict(
+            [
+                ("Filename", fname),
+                ("Format", stats["standard"]["source_format"]),
+                ("Station", stats["station"]),
+                ("Network", stats["network"]),
+                ("Source", stats["standard"]["source"]),
+                ("Location", stats["location"]),
+                ("Coordinates", locstr),
+            ]
+        )
+        channels = []
+        for trace in stream:
+            channel = OrderedDict()
+            stats = trace.stats
+            channel["Channel"] = stats["channel"]
+            channel["Start Time"] = stats["starttime"]
+            channel["End Time"] = stats["endtime"]
+            channel["Number of Points"] = stats["npts"]
+            channel["Units"] = stats["standard"]["units"]
+            channel["Peak Value"] = trace.max()
+            channels.append(channel)
+    except Exception as e:
+        return (fname, None, None, e)
+    return (fname, mydict, channels, None)
+
+
+def _format_fields(fields, prefix=""):
+    """Format a dictionary as aligned "key  value" lines.
+
+    Args:
+        fields (dict):
+            Field names and values.
+        prefix (str):
+            String to put at the start of each line.
+
+    Returns:
+        str: Formatted lines.
+    """
+    width = max(len(key) for key in fields)
+    lines = [f"{prefix}{key:<{width}}    {value}" for key, value in fields.items()]
+    return "\n".join(lines)
+
+
 def render_verbose(files):
     config = confmod.get_config()
-    error_rows = []
-    for fname in files:
-        try:
-            fmt = readmod._get_format(fname, config)
-            stream = readmod.read_data(fname, config)[0]
-            stats = stream[0].stats
-            tpl = (
-                stats["coordinates"]["latitude"],
-                stats["coordinates"]["longitude"],
-                stats["coordinates"]["elevation"],
-            )
-            locstr = "Lat: %.4f Lon: %.4f Elev: %.1f" % tpl
-            mydict = OrderedDict(
-                [
-                    ("Filename", fname),
-                    ("Format", fmt),
-                    ("Station", stats["station"]),
-                    ("Network", stats["network"]),
-                    ("Source", stats["standard"]["source"]),
-                    ("Location", stats["location"]),
-                    ("Coordinates", locstr),
-                ]
-            )
-            print()
-
-            print(pd.Series(mydict).to_string())
-            for trace in stream:
-                channel = OrderedDict()
-                stats = trace.stats
-                channel["Channel"] = stats["channel"]
-                channel["Start Time"] = stats["starttime"]
-                channel["End Time"] = stats["endtime"]
-                channel["Number of Points"] = stats["npts"]
-                channel["Units"] = stats["standard"]["units"]
-                channel["Peak Value"] = trace.max()
-                print()
-                chstr = pd.Series(channel).to_string()
-                parts = ["\t" + line for line in chstr.split("\n")]
-                chstr = "\n".join(parts)
-                print(chstr)
-        except BaseException as e:
-            row = {}
-            row["Filename"] = str(fname)
-            row["Error"] = str(e)
-            error_rows.append(row)
-            continue
-    errors = pd.DataFrame(error_rows)
+    err_fnames, err_msgs = [], []
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda fname: _inspect_one(fname, config), files)
+        # print from this thread only so the output is not interleaved
+        for fname, mydict, channels, error in results:
+            if error is not None:
+                err_fnames.append(str(fname))
+                err_msgs.append(str(error))
+                continue
+            # build the whole block for the file and write it in one call
+            parts = ["", _format_fields(mydict)]
+            for channel in channels:
+                parts.append("")
+                parts.append(_format_fields(channel, prefix="\t"))
+            sys.stdout.write("\n".join(parts) + "\n")
+    errors = pd.DataFrame({"Filename": err_fnames, "Error": err_msgs})
     return errors
 
 
-def cli():
-    """Command line interface for gminfo"""
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the gminfo argument parser once and reuse it on later calls."""
 
     description = """Display summary information about a file, multiple files,
     or directories of files containing strong motion data in the supported
@@ -246,6 +426,8 @@ def cli():
 
     shelp = """Save concise results to CSV/Excel file
     (format determined by extension (.xlsx for Excel, anything else for CSV.))
+    CSV rows are written in the order the files are read, while Excel rows
+    are sorted by network, station, and channel.
     """
     parser.add_argument("-s", "--save", metavar="OUTFILE", help=shelp)
 
@@ -254,6 +436,13 @@ def cli():
 
     # Shared arguments
     parser = argmod.add_shared_args(parser)
+    return parser
+
+
+def cli():
+    """Command line interface for gminfo"""
+
+    parser = _build_parser()
 
     if len(sys.argv) == 1:
         parser.print_help(sys.stderr)
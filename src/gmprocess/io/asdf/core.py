@@ -33,7 +33,7 @@ def is_asdf(filename, config=None):
         return False
 
 
-def read_asdf(filename, eventid=None, stations=None, label=None):
+def read_asdf(filename, eventid=None, stations=None, label=None, **kwargs):
     """Read Streams of data (complete with processing metadata) from an ASDF
     file.
 
@@ -42,6 +42,8 @@ def read_asdf(filename, eventid=None, stations=None, label=None):
             Path to valid ASDF file.
         label (str):
             Optional processing label to filter streams.
+        kwargs (ref):
+            Other arguments will be ignored.
 
     Returns:
         list:
@@ -66,7 +66,7 @@ def is_nsmn(filename, config=None):
     return False
 
 
-def read_nsmn(filename, config=None):
+def read_nsmn(filename, config=None, **kwargs):
     """Read the Turkish NSMN strong motion data format.
 
     Args:
@@ -74,6 +74,8 @@ def read_nsmn(filename, config=None):
             path to NSMN data file.
         config (dict):
             Dictionary containing configuration.
+        kwargs (ref):
+            Other arguments will be ignored.
 
     Returns:
         list: Sequence of one StationStream object containing 3 StationTrace
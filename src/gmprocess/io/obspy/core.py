@@ -6,6 +6,8 @@ import logging
 import os
 import re
 
+import numpy as np
+
 from gmprocess.core.stationstream import StationStream
 
 # local imports
@@ -120,7 +122,8 @@ def is_obspy(filename, config=None):
     if not os.path.isfile(filename):
         return False
     try:
-        stream = read(filename)
+        # the format is in the headers, so the samples are not needed
+        stream = read(filename, headonly=True)
         if stream[0].stats._format in IGNORE_FORMATS:
             return False
         if stream[0].stats._format in REQUIRES_XML:
@@ -143,6 +146,8 @@ def read_obspy(filename, config=None, **kwargs):
         config (dict):
             Dictionary containing configuration. If None, retrieve global config.
         kwargs (ref):
+            headonly (bool): Only read the headers; the data samples are all
+            set to zero.
             Other arguments will be ignored.
 
     Returns:
@@ -166,8 +171,10 @@ def read_obspy(filename, config=None, **kwargs):
         except BaseException:
             exclude_patterns = EXCLUDE_PATTERNS
 
+    headonly = kwargs.get("headonly", False)
+
     streams = []
-    tstream = read(filename)
+    tstream = read(filename, headonly=headonly)
     try:
         metdir = config["read"]["metadata_directory"]
         xmlfile = _get_station_file(filename, tstream, metdir)
@@ -177,8 +184,15 @@ def read_obspy(filename, config=None, **kwargs):
     traces = []
 
     for ttrace in tstream:
+        data = ttrace.data
+        if headonly:
+            # The samples were not read, so use zeros with the length given in
+            # the header; this keeps npts consistent with the data for
+            # validation and for trimming the stream. np.zeros does not touch
+            # the memory until it is written to.
+            data = np.zeros(ttrace.stats.npts)
         trace = StationTrace(
-            data=ttrace.data, header=ttrace.stats, inventory=inventory, config=config
+            data=data, header=ttrace.stats, inventory=inventory, config=config
         )
         network = ttrace.stats.network
         station = ttrace.stats.station
@@ -234,7 +248,8 @@ def read_obspy(filename, config=None, **kwargs):
         trace.stats["standard"]["source_file"] = tail or os.path.basename(head)
 
         # Do SAC-specific stuff
-        if "_format" in trace.stats and trace.stats._format.lower() == "sac":
+        is_sac = "_format" in trace.stats and trace.stats._format.lower() == "sac"
+        if is_sac and not headonly:
             # Apply conversion factor if one was specified for this format
             trace.data *= float(config["read"]["sac_conversion_factor"])
 
@@ -24,6 +24,8 @@ def read_data(filename, config=None, read_format=None, **kwargs):
             Dictionary containing configuration.
         read_format (str):
             Format of file
+        kwargs (ref):
+            Passed on to the format-specific reader (e.g., headonly).
 
     Returns:
         list: Sequence of StationStream objects.
@@ -148,7 +150,7 @@ def _validate_format(filename, config, read_format):
     # Create valid list
     for module in io_directory.iterdir():
         if module.name.find(".") < 0 and module.name not in EXCLUDED_MODS:
-            valid_formats += [module]
+            valid_formats += [module.name]
     # Check for a valid format
     if read_format in valid_formats:
         reader = f"gmprocess.io.{read_format}.core"
@@ -178,8 +178,30 @@ def _walk_and_unzip(directory):
 
 
 def _walk(path):
-    for p in path.iterdir():
-        if p.is_dir():
-            yield from _walk(p)
+    """Recursively yield the resolved paths of all files under a directory.
+
+    Args:
+        path (str or pathlib.Path):
+            Directory to walk.
+
+    Yields:
+        pathlib.Path: Resolved path of each file.
+    """
+    yield from _scan_dir(Path(path).resolve())
+
+
+def _scan_dir(directory):
+    # os.scandir gets the entry type from the directory listing itself, so we
+    # avoid a stat per entry, and only symlinks need to be resolved since the
+    # parent directory is already resolved. The entries are read up front
+    # because callers may add or remove files while iterating.
+    with os.scandir(directory) as it:
+        entries = list(it)
+    for entry in entries:
+        path = directory / entry.name
+        if entry.is_symlink():
+            path = path.resolve()
+        if entry.is_dir():
+            yield from _scan_dir(path)
             continue
-        yield p.resolve()
+        yield path
@@ -1,8 +1,50 @@
+import io
 import shutil
 from pathlib import Path
 
+import pandas as pd
+import pytest
+
 from gmprocess.utils.constants import TEST_DATA_DIR
-from gmprocess.bin.gminfo import App
+from gmprocess.bin import gminfo
+from gmprocess.bin.gminfo import (
+    App,
+    COLUMNS,
+    render_concise,
+    render_dir,
+    render_verbose,
+    _write_csv,
+)
+
+GEONET_FILE = "20180212_211557_WPWS_20.V2A"
+STATION_FIELDS = [
+    "Filename",
+    "Format",
+    "Station",
+    "Network",
+    "Source",
+    "Location",
+    "Coordinates",
+]
+CHANNEL_FIELDS = [
+    "Channel",
+    "Start Time",
+    "End Time",
+    "Number of Points",
+    "Units",
+    "Peak Value",
+]
+
+
+def _field_values(out, field):
+    # values of a field in the verbose output, in the order they are printed
+    values = []
+    for line in out.splitlines():
+        parts = line.split()
+        if line.strip().startswith(field) and len(parts) > len(field.split()):
+            values.append(" ".join(parts[len(field.split()) :]))
+    return values
+
 
 def test_gminfo():
     input_dir = TEST_DATA_DIR / "geonet" / "nz2018p115908"
@@ -23,3 +65,134 @@ def test_gminfo():
         raise e
     finally:
         shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def _copy_mixed_folder(folder):
+    # one geonet file and the three components of one knet station
+    folder.mkdir()
+    geonet_file = TEST_DATA_DIR / "geonet" / "nz2018p115908" / GEONET_FILE
+    knet_files = sorted((TEST_DATA_DIR / "knet" / "us2000cnnl").glob("AOM001*"))
+    for src in [geonet_file] + knet_files:
+        shutil.copy(src, folder)
+    return sorted(folder.iterdir())
+
+
+def test_gminfo_verbose_formats(tmp_path, capsys):
+    # every file in a single-format folder is read with that format
+    files = [TEST_DATA_DIR / "geonet" / "nz2018p115908" / GEONET_FILE]
+    errors = render_verbose(files)
+    assert len(errors) == 0
+    out = capsys.readouterr().out
+    assert _field_values(out, "Format") == ["geonet"]
+
+    # files in a mixed-format folder are each read with their own format
+    files = _copy_mixed_folder(tmp_path / "mixed")
+    errors = render_verbose(files)
+    assert len(errors) == 0
+    out = capsys.readouterr().out
+    assert _field_values(out, "Format") == ["geonet", "knet", "knet", "knet"]
+
+
+def test_gminfo_verbose_ambiguous(tmp_path, monkeypatch, capsys):
+    files = _copy_mixed_folder(tmp_path / "mixed")
+
+    # make the geonet file also pass the knet check
+    monkeypatch.setattr(
+        "gmprocess.io.knet.core.is_knet", lambda filename, config=None: True
+    )
+    errors = render_verbose(files)
+    assert errors["Filename"].tolist() == [str(files[0])]
+    assert "Multiple formats passing" in errors["Error"].iloc[0]
+    out = capsys.readouterr().out
+    assert _field_values(out, "Format") == ["knet", "knet", "knet"]
+
+
+def test_gminfo_write_csv():
+    # the catalog must not depend on whether pyarrow happens to be installed
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {
+            "Filename": [Path("a.V2A"), Path("b.V2A")],
+            "Station": ["WPWS", None],
+            "Sampling Rate (Hz)": [100.0, 200.0],
+            "Latitude": [-41.5, float("nan")],
+        }
+    )
+    fh = io.BytesIO()
+    _write_csv(df, fh)
+    assert fh.getvalue() == df.to_csv(index=False).encode()
+
+
+def test_gminfo_concise_csv(tmp_path):
+    input_dir = TEST_DATA_DIR / "geonet" / "nz2018p115908"
+    df, _ = render_dir(input_dir, concise=True, save=True)
+
+    # the streamed CSV has the same rows as the in-memory catalog
+    outfile = tmp_path / "catalog.csv"
+    streamed, errors = render_dir(input_dir, concise=True, save=True, outfile=outfile)
+    assert streamed is None
+    catalog = pd.read_csv(outfile)
+    assert catalog.columns.tolist() == COLUMNS
+    assert len(catalog) == len(df)
+    assert sorted(catalog["Channel"]) == sorted(df["Channel"])
+    assert list(tmp_path.iterdir()) == [outfile]
+
+    # an empty catalog still has the header
+    outfile = tmp_path / "empty.csv"
+    render_concise([], save=True, outfile=outfile)
+    catalog = pd.read_csv(outfile)
+    assert catalog.columns.tolist() == COLUMNS
+    assert len(catalog) == 0
+
+
+def test_gminfo_concise_csv_failure(tmp_path, monkeypatch):
+    files = [TEST_DATA_DIR / "geonet" / "nz2018p115908" / GEONET_FILE]
+    outfile = tmp_path / "catalog.csv"
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("write failed")
+
+    monkeypatch.setattr(gminfo, "_write_csv", fail)
+    with pytest.raises(RuntimeError):
+        render_concise(files, save=True, outfile=outfile)
+    # neither a partial catalog nor the temporary file is left behind
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_gminfo_verbose_output(capsys):
+    files = [TEST_DATA_DIR / "geonet" / "nz2018p115908" / GEONET_FILE]
+    errors = render_verbose(files)
+    assert len(errors) == 0
+    out = capsys.readouterr().out
+
+    # a blank line before the station block and before each channel block
+    blocks = out.split("\n\n")
+    assert blocks[0] == ""
+    station = blocks[1].splitlines()
+    channels = [block.splitlines() for block in blocks[2:]]
+    assert len(channels) == 3
+    assert [line.split()[0] for line in station] == [
+        field.split()[0] for field in STATION_FIELDS
+    ]
+    for channel in channels:
+        assert all(line.startswith("\t") for line in channel)
+        assert [line.split()[0] for line in channel] == [
+            field.split()[0] for field in CHANNEL_FIELDS
+        ]
+    assert out.endswith("\n") and not out.endswith("\n\n")
+
+    # keys are padded to the longest key and values follow four spaces later
+    width = max(len(field) for field in STATION_FIELDS)
+    for field, line in zip(STATION_FIELDS, station):
+        assert line.startswith(field.ljust(width) + "    ")
+        assert line[width + 4] != " "
+    width = max(len(field) for field in CHANNEL_FIELDS)
+    for channel in channels:
+        for field, line in zip(CHANNEL_FIELDS, channel):
+            assert line.startswith("\t" + field.ljust(width) + "    ")
+            assert line[width + 5] != " "
+
+    # the format is the source format recorded by the reader
+    assert _field_values(out, "Filename") == [str(files[0])]
+    assert _field_values(out, "Format") == ["geonet"]
+    assert _field_values(out, "Station") == ["WPWS"]
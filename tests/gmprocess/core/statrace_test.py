@@ -7,7 +7,7 @@ from gmprocess.core.stationtrace import StationTrace
 
 
 def test_trace():
-    data = np.random.rand(1000)
+    data = np.arange(1000, dtype=np.float64)
     header = {
         "sampling_rate": 1,
         "npts": len(data),
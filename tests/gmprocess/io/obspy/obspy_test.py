@@ -192,5 +192,23 @@ def test():
     assert channels == ["HN2", "HN3", "HNZ"]
 
 
+def test_headonly():
+    datafiles, _ = read_data_dir("fdsn", "nc72282711", "BK.CMB*.mseed")
+    datafiles += read_data_dir("csn", "ci38457511", "*.sac")[0]
+    datafiles.sort()
+    for datafile in datafiles:
+        full = read_obspy(datafile)[0]
+        head = read_obspy(datafile, headonly=True)[0]
+        assert len(head) == len(full)
+        for tr_full, tr_head in zip(full, head):
+            assert tr_head.stats.channel == tr_full.stats.channel
+            assert tr_head.stats.npts == tr_full.stats.npts
+            assert tr_head.stats.starttime == tr_full.stats.starttime
+            assert tr_head.stats.endtime == tr_full.stats.endtime
+            assert tr_head.stats.sampling_rate == tr_full.stats.sampling_rate
+            assert len(tr_head.data) == tr_head.stats.npts
+            assert not np.any(tr_head.data)
+
+
 if __name__ == "__main__":
     test_channel_exclusion()
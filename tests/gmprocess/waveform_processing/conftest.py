@@ -37,8 +37,8 @@ def fdsn_nc51194936():
     yield streams, event
 
 
-# Scope to `function` level to prevent mutation of streams when parametrizing tests
-@pytest.fixture(scope="function")
+# Read once per session; tests that modify the streams must copy them first
+@pytest.fixture(scope="session")
 def fdsn_ci38457511_CLC():
     # Returns data and event object from a single station as a StationStream
     data_files, event = read_data_dir("fdsn", "ci38457511", "*.mseed")
@@ -7,7 +7,6 @@ from gmprocess.waveform_processing.corner_frequencies import (
 
 def test_corner_frequencies(setup_corner_freq_test):
     _, event, processed_streams = setup_corner_freq_test
-    processed_streams = processed_streams.copy()
 
     lp = []
     hp = []
@@ -30,7 +29,6 @@ def test_corner_frequencies(setup_corner_freq_test):
 
 def test_corner_frequencies_magnitude(setup_corner_freq_mag_test):
     _, event, processed_streams = setup_corner_freq_mag_test
-    processed_streams = processed_streams.copy()
 
     lp = []
     hp = []
@@ -7,6 +7,7 @@ from gmprocess.waveform_processing import windows
 
 def test_windows_cut(fdsn_ci38457511_CLC):
     streams, event = fdsn_ci38457511_CLC
+    streams = streams.copy()
 
     st = windows.signal_split(streams, event=event)
     st = windows.signal_end(
@@ -27,6 +28,7 @@ def test_windows_cut(fdsn_ci38457511_CLC):
 
 def test_windows_no_split_time(fdsn_ci38457511_CLC):
     streams, _ = fdsn_ci38457511_CLC
+    streams = streams.copy()
 
     windows.window_checks(streams)
     assert (
@@ -44,6 +46,7 @@ def test_windows_no_split_time(fdsn_ci38457511_CLC):
 )
 def test_windows_durations(method, target, fdsn_ci38457511_CLC):
     streams, event = fdsn_ci38457511_CLC
+    streams = streams.copy()
 
     streams = windows.signal_split(streams, event=event)
     streams = windows.signal_end(
@@ -74,6 +77,7 @@ def test_windows_durations(method, target, fdsn_ci38457511_CLC):
 )
 def test_signal_end_methods(method, target, fdsn_ci38457511_CLC):
     streams, event = fdsn_ci38457511_CLC
+    streams = streams.copy()
 
     streams = windows.signal_split(streams, event=event)
 
@@ -96,9 +100,9 @@ def test_signal_end_methods(method, target, fdsn_ci38457511_CLC):
 
 def test_signal_split2(load_data_us1000778i):
     streams, event = load_data_us1000778i
-    streams = streams.copy()
 
-    stream = streams[0]
+    # Only this stream is modified, so there is no need to copy the others
+    stream = streams[0].copy()
     windows.signal_split(stream, event)
 
     cmpdict = {